@@ -4,6 +4,7 @@ beamformer calibration.
 """
 
 import logging
+import warnings
 
 import numpy
 from numpy.polynomial import polynomial
@@ -48,28 +49,46 @@ def set_beamformer_frequencies(gain_table: GainTable, array=None):
         log.warning("Cannot rechannelise %d channel[s]", nfrequency_gt)
         return frequency_gt
 
+    # gaintable frequencies are in increasing order, so the band edges are
+    # the first and last channels
+    if frequency_gt[0] > frequency_gt[-1]:
+        raise ValueError("Expect frequencies in increasing order")
+
     if array is None:
-        if array_name.find("LOW") == 0:
+        if array_name.startswith("LOW"):
             array = "LOW"
-        elif array_name.find("MID") == 0:
+        elif array_name.startswith("MID"):
             array = "MID"
 
     if array == "LOW":
         log.debug("Setting SKA-Low CBF beamformer frequencies")
         dfrequency_bf = 781.25e3
         starting_freq_bf = dfrequency_bf * numpy.round(
-            numpy.amin(frequency_gt) / dfrequency_bf
+            frequency_gt[0] / dfrequency_bf
         )
     elif array == "MID":
         log.debug("Setting SKA-Mid CBF beamformer frequencies")
         dfrequency_bf = 300.0e6 / 4096
-        starting_freq_bf = numpy.amin(frequency_gt)
+        starting_freq_bf = frequency_gt[0]
     else:
         log.warning("Unknown array: %s. Frequencies unchanged", array_name)
         return frequency_gt
 
-    frequency_bf = numpy.arange(
-        starting_freq_bf, numpy.amax(frequency_gt), dfrequency_bf
+    # count the output channels up to and including the last input channel
+    # frequency, then set each one from its integer channel index, so that
+    # neither the number of channels nor the frequencies depend on any
+    # rounding in a floating-point numpy.arange. A last input channel that
+    # is on the output grid to within rounding counts as on the grid
+    nfrequency_bf = (
+        int(
+            numpy.floor(
+                (frequency_gt[-1] - starting_freq_bf) / dfrequency_bf + 1e-9
+            )
+        )
+        + 1
+    )
+    frequency_bf = starting_freq_bf + dfrequency_bf * numpy.arange(
+        nfrequency_bf
     )
 
     log.info("Setting bandpass calibration frequencies for %s CBF", array)
@@ -90,7 +109,7 @@ def set_beamformer_frequencies(gain_table: GainTable, array=None):
 
 
 def expand_delay_phase(
-    gain_table: GainTable, frequency, reference_to_centre=True
+    gain_table: GainTable, frequency, reference_to_centre=True, dtype=None
 ) -> GainTable:
     """CASA delay calibration tables with type K or Kcross are currently stored
     in GainTable Jones matrices as phase shifts at a single reference
@@ -108,6 +127,9 @@ def expand_delay_phase(
         is done in CASA calibration tasks when delay solutions are given as
         prior calibration terms, so also needs to be done when combining delay
         with any subsequent calibration solutions.
+    :param dtype: complex dtype of the expanded gains, e.g. complex64 to
+        halve their memory footprint and that of any products with them
+        [default: the gain dtype of the input table]
     :return: GainTable array with len(frequency) phase values
     """
     if gain_table.jones_type != "K":
@@ -118,24 +140,17 @@ def expand_delay_phase(
         raise ValueError("Expect a single frequency")
     frequency0 = gain_table.frequency.data[0]
 
-    shape = numpy.array(gain_table.gain.shape)
-    shape[2] = len(frequency)
-
-    gain = numpy.empty(shape, "complex128")
-
-    # Set the gain weight to one and residual to zero
-    weight = numpy.ones(shape)
-    residual = numpy.zeros((shape[0], shape[2], shape[3], shape[4]))
-
-    # only works if the delay at ref freq is less than half a wavelength
-    phase0 = numpy.angle(gain_table.gain.data)
+    gain = _expand_delay_phase_array(
+        gain_table.gain.data, frequency0, frequency, reference_to_centre, dtype
+    )
+    shape = gain.shape
 
-    for chan, freq in enumerate(frequency):
-        if reference_to_centre:
-            freq -= frequency0
-        gain[:, :, chan, :, :] = numpy.exp(
-            1j * freq / frequency0 * phase0[:, :, 0, :, :]
-        )
+    # Set the gain weight to one and residual to zero. These need to stay
+    # writeable, since solve_gaintable writes its weights and residuals
+    # into them, so are not broadcast. They are kept in double precision,
+    # as in the GainTables they may later be combined with
+    weight = numpy.ones(shape, "float64")
+    residual = numpy.zeros((shape[0], shape[2], shape[3], shape[4]), "float64")
 
     return GainTable.constructor(
         gain=gain,
@@ -151,6 +166,54 @@ def expand_delay_phase(
     )
 
 
+def _expand_delay_phase_array(
+    gain, frequency0, frequency, reference_to_centre=True, dtype=None
+):
+    """Expand delay phase shifts at a single frequency to other frequencies
+
+    This is the numerical part of expand_delay_phase, for callers that only
+    need the gain array. No checks are made on the input.
+
+    :param gain: numpy array of shape [ntime, nant, 1, nrec, nrec]
+        containing the phase shifts at the reference frequency
+    :param frequency0: reference frequency in Hz
+    :param frequency: list of frequencies in Hz to generate phase shifts for
+    :param reference_to_centre: if true (the default), shift the phases such
+        that the phase shift at the reference frequency is zero
+    :param dtype: complex dtype of the output [default: the dtype of gain]
+    :return: numpy array of shape [ntime, nant, len(frequency), nrec, nrec]
+    """
+    shape = numpy.array(gain.shape)
+    shape[2] = len(frequency)
+
+    gain_out = numpy.empty(shape, gain.dtype if dtype is None else dtype)
+
+    # only works if the delay at ref freq is less than half a wavelength.
+    # The angles are taken once, for the reference channel alone, and are
+    # then broadcast across the output channels rather than recomputed
+    phase0 = numpy.angle(gain[:, :, 0:1, :, :])
+
+    # scale the reference phases to all output channels in a single pass
+    freq = numpy.ascontiguousarray(frequency, "float64")
+    if reference_to_centre:
+        freq = freq - frequency0
+    # evaluate the phases at the output precision, so that single-precision
+    # gains also get single-precision cos and sin
+    real_dtype = gain_out.real.dtype
+    ratio = (freq / frequency0).astype(real_dtype).reshape(1, 1, -1, 1, 1)
+    phase = (ratio * phase0).astype(real_dtype, copy=False)
+
+    # exp(1j * phase), evaluated with real cos and sin directly into the
+    # real and imaginary parts of the gain. All four Jones terms are
+    # evaluated, even for diagonal delay tables, since the contiguous passes
+    # are faster than evaluating the diagonal alone and scattering it with
+    # strided stores
+    numpy.cos(phase, out=gain_out.real)
+    numpy.sin(phase, out=gain_out.imag)
+
+    return gain_out
+
+
 def _set_gaintable_product_shape(
     gain_table1: GainTable, gain_table2: GainTable, elementwise=False
 ):
@@ -162,37 +225,33 @@ def _set_gaintable_product_shape(
         Default is False.
     :return: Shape of the combined GainTable
     """
-    gain1 = gain_table1.gain.data
-    gain2 = gain_table2.gain.data
+    shape1 = gain_table1.gain.shape
+    shape2 = gain_table2.gain.shape
 
-    if gain1.shape[0] != gain2.shape[0]:
-        raise ValueError("time error {gain1.shape[0]} != {gain2.shape[0]}")
-    if gain1.shape[1] != gain2.shape[1]:
-        raise ValueError("antenna error {gain1.shape[1]} != {gain2.shape[1]}")
+    if shape1[0] != shape2[0]:
+        raise ValueError(f"time error {shape1[0]} != {shape2[0]}")
+    if shape1[1] != shape2[1]:
+        raise ValueError(f"antenna error {shape1[1]} != {shape2[1]}")
     # Tables must have the same number of channels, unless one set is constant
     # with a single Jones matrix per time and antenna
-    if (
-        gain1.shape[2] != gain2.shape[2]
-        and gain1.shape[2] != 1
-        and gain2.shape[2] != 1
-    ):
-        raise ValueError("frequency error {gain1.shape} != {gain2.shape}")
+    if shape1[2] != shape2[2] and shape1[2] != 1 and shape2[2] != 1:
+        raise ValueError(f"frequency error {shape1} != {shape2}")
     if elementwise:
-        if gain1.shape[3] != gain2.shape[3]:
-            raise ValueError("pol error {gain1.shape[3]} != {gain2.shape[3]}")
-        if gain1.shape[4] != gain2.shape[4]:
-            raise ValueError("pol error {gain1.shape[4]} != {gain2.shape[4]}")
+        if shape1[3] != shape2[3]:
+            raise ValueError(f"pol error {shape1[3]} != {shape2[3]}")
+        if shape1[4] != shape2[4]:
+            raise ValueError(f"pol error {shape1[4]} != {shape2[4]}")
     else:
         # Make sure that ncol of matrix 1 equals nrow of matrix 2
         if gain_table1.receptor2.shape != gain_table2.receptor1.shape:
             raise ValueError("Matrices not compatible for multiplication")
 
     return (
-        gain1.shape[0],
-        gain1.shape[1],
-        max(gain1.shape[2], gain2.shape[2]),
-        gain1.shape[3],
-        gain2.shape[4],
+        shape1[0],
+        shape1[1],
+        max(shape1[2], shape2[2]),
+        shape1[3],
+        shape2[4],
     )
 
 
@@ -208,46 +267,29 @@ def multiply_gaintable_jones(
         This is needed for gain tables that contain different factors of the
         same effect and need to be multiplied outside of the Jones formalism,
         such as D leakage terms and K cross-pol delays. Default is False.
-    :return: GainTable containing gain_table1 Jones * gain_table2 Jones
+    :return: GainTable containing gain_table1 Jones * gain_table2 Jones,
+        with gains of the promoted dtype of the two input tables (e.g.
+        complex64 if both inputs are stored in single precision)
     """
     if gain_table1.jones_type == "K" or gain_table2.jones_type == "K":
         raise ValueError("Cannot multiply delays. Use expand_delay_phase")
 
+    # check that the tables are compatible
     shape = _set_gaintable_product_shape(gain_table1, gain_table2, elementwise)
 
-    gain = numpy.empty(shape, "complex128")
-
-    # Map output channel indices to input channel indices
-    chan1 = numpy.arange(shape[2]).astype("int")
-    chan2 = numpy.arange(shape[2]).astype("int")
-    if gain_table1.gain.shape[2] == 1:
-        chan1 *= 0
-    if gain_table2.gain.shape[2] == 1:
-        chan2 *= 0
-
-    for time in range(0, shape[0]):
-        for ant in range(0, shape[1]):
-            for chan in range(0, shape[2]):
-                if elementwise:
-                    gain[time, ant, chan] = (
-                        gain_table1.gain.data[time, ant, chan1[chan]]
-                        * gain_table2.gain.data[time, ant, chan2[chan]]
-                    )
-                else:
-                    gain[time, ant, chan] = (
-                        gain_table1.gain.data[time, ant, chan1[chan]]
-                        @ gain_table2.gain.data[time, ant, chan2[chan]]
-                    )
+    gain = _multiply_gaintable_jones_array(
+        gain_table1.gain.data, gain_table2.gain.data, elementwise, shape
+    )
 
     # Get the frequencies, noting that one set may be of length 1
     if gain_table1.gain.shape[2] > 1:
         frequency = gain_table1.frequency.data
-        weight = gain_table1.weight
-        residual = gain_table1.residual
+        weight = gain_table1.weight.data
+        residual = gain_table1.residual.data
     else:
         frequency = gain_table2.frequency.data
-        weight = gain_table2.weight
-        residual = gain_table2.residual
+        weight = gain_table2.weight.data
+        residual = gain_table2.residual.data
 
     # If the two tables have the same jones_type use that
     # Otherwise assume a general form and use B
@@ -258,8 +300,8 @@ def multiply_gaintable_jones(
 
     return GainTable.constructor(
         gain=gain,
-        time=gain_table1.time,
-        interval=gain_table1.interval,
+        time=gain_table1.time.data,
+        interval=gain_table1.interval.data,
         weight=weight,
         residual=residual,
         frequency=frequency,
@@ -270,40 +312,144 @@ def multiply_gaintable_jones(
     )
 
 
+def _multiply_gaintable_jones_array(
+    gain1, gain2, elementwise=False, shape=None
+):
+    """Multiply two arrays of Jones matrices
+
+    This is the numerical part of multiply_gaintable_jones, for callers that
+    combine several gain arrays and only need a GainTable at the end. The
+    arrays are not checked for compatibility; see
+    _set_gaintable_product_shape, which also returns the shape of the product.
+
+    :param gain1: numpy array of shape [ntime, nant, nchan1, nrec1, nrec2]
+        containing left-hand side Jones matrices
+    :param gain2: numpy array of shape [ntime, nant, nchan2, nrec2, nrec3]
+        containing right-hand side Jones matrices. nchan1 and nchan2 must
+        be equal unless one of them is 1
+    :param elementwise: Do elementwise multiplication of calibration terms.
+        Default is False.
+    :param shape: Shape of the product, if already known from
+        _set_gaintable_product_shape. Default is None, to compute it here.
+    :return: numpy array of shape [ntime, nant, max(nchan1, nchan2), nrec1,
+        nrec3] with the promoted dtype of gain1 and gain2
+    """
+    if shape is None:
+        shape = (
+            gain1.shape[0],
+            gain1.shape[1],
+            max(gain1.shape[2], gain2.shape[2]),
+            gain1.shape[3],
+            gain2.shape[4],
+        )
+
+    gain = numpy.empty(shape, numpy.result_type(gain1.dtype, gain2.dtype))
+
+    # Broadcast any single-channel table across the output channels. These
+    # are read-only views, so the input Jones matrices are not copied
+    gain1 = numpy.broadcast_to(gain1, shape[:3] + gain1.shape[3:])
+    gain2 = numpy.broadcast_to(gain2, shape[:3] + gain2.shape[3:])
+
+    # Multiply all times, antennas and channels in a single batched call.
+    # numpy.matmul gives the same result as each 2x2 product on its own, and
+    # is faster than both einsum and explicit element-by-element products of
+    # the Jones terms across the batch
+    if elementwise:
+        numpy.multiply(gain1, gain2, out=gain)
+    else:
+        numpy.matmul(gain1, gain2, out=gain)
+
+    return gain
+
+
 def resample_bandpass(
     frequency_out,
     gain_table: GainTable,
     alg="polyfit",
     edges=None,
     polydeg=None,
+    interpolator=None,
 ):
     """Re-channelise each spectrum of gain or leakage terms
 
     algorithms:
-     - polyfit  numpy.polynomial.polyval [default]
+     - polyfit  least-squares polynomial fit [default]
            polynomial fit to the real and imaginary part of each calibration
-           parameter
-     - cubicspl scipy.interpolate.CubicSpline
+           parameter, as numpy.polynomial.polynomial.polyfit
+     - cubicspl scipy.interpolate.make_interp_spline
            cubic spline fit to the real and imaginary part of each calibration
-           parameter
-     - interp   numpy.interp
+           parameter, with the not-a-knot conditions of CubicSpline
+     - interp   linear interpolation, as numpy.interp
            binomial interpolation the real and imaginary part of each
            calibration parameter
 
+    All time, antenna and receptor spectra are resampled together, so the
+    cost of setting up each fit is shared by the whole table.
+
     :param frequency_out: numpy array of shape [nfreq_out,]
     :param gain_table: GainTable
     :param alg: algorithm type [default polyfit]
     :param edges: list of edges (polyfit only) [default none]
     :param polydeg: degree of the fitting polynomial (polyfit only) [default 3]
-    :return: numpy array of shape [nfreq_out,]
+    :param interpolator: interpolator to use in place of one set up from alg,
+        edges and polydeg, e.g. a PolynomialInterpolator. Interpolators keep
+        their fit matrices, so passing the same one to repeated calls with
+        the same frequencies avoids setting up the fits again [default none]
+    :return: numpy array of shape [ntime, nant, nfreq_out, nrec, nrec], with
+        the same dtype as the input gains. The interpolation itself is done
+        in double precision.
     """
 
-    frequency_gt = gain_table.frequency.data
+    frequency_gt = numpy.ascontiguousarray(
+        gain_table.frequency.data, "float64"
+    )
+    frequency_out = numpy.ascontiguousarray(frequency_out, "float64")
 
+    if interpolator is None:
+        interpolator = get_bandpass_interpolator(
+            len(frequency_gt), alg=alg, edges=edges, polydeg=polydeg
+        )
+
+    gain = gain_table.gain.data
+    shape_out = numpy.array(gain.shape)
+    shape_out[2] = len(frequency_out)
+    gain_out = numpy.empty(shape_out, gain.dtype)
+
+    # Interpolate all time, antenna and receptor spectra in a single call,
+    # with frequency along the first axis and one spectrum per column. The
+    # reshape gathers the spectra into a C-contiguous array for the kernels
+    spectra = numpy.moveaxis(gain, 2, 0).reshape(gain.shape[2], -1)
+    spectra_out = numpy.moveaxis(gain_out, 2, 0)
+    result = interpolator.interp(frequency_out, frequency_gt, spectra).reshape(
+        spectra_out.shape
+    )
+
+    # Write the frequency-major result back in blocks of output channels.
+    # Each block is small enough to stay in cache while it is scattered
+    # into the strided output, which is about twice as fast as a single
+    # copy for large tables
+    nblock = 16
+    for chan in range(0, len(frequency_out), nblock):
+        spectra_out[chan : chan + nblock] = result[chan : chan + nblock]
+
+    return gain_out
+
+
+def get_bandpass_interpolator(
+    nfrequency, alg="polyfit", edges=None, polydeg=None
+):
+    """Set up an interpolator for resample_bandpass
+
+    :param nfrequency: number of input frequency channels
+    :param alg: algorithm type, polyfit, interp or cubicspl [default polyfit]
+    :param edges: list of edges (polyfit only) [default none]
+    :param polydeg: degree of the fitting polynomial (polyfit only) [default 3]
+    :return: interpolator object with an interp(freq_out, freq_in, gain) method
+    """
     if alg == "polyfit":
         interpolator = PolynomialInterpolator()
         if edges is not None:
-            interpolator.set_edges(edges, len(frequency_gt))
+            interpolator.set_edges(edges, nfrequency)
         if polydeg is not None:
             interpolator.set_polydeg(polydeg)
     elif alg == "interp":
@@ -313,24 +459,14 @@ def resample_bandpass(
     else:
         raise ValueError(f"unknown resampler {alg}")
 
-    gain = gain_table.gain.data
-    shape_out = numpy.array(gain.shape)
-    shape_out[2] = len(frequency_out)
-    gain_out = numpy.empty(shape_out, "complex128")
-    for time in range(0, shape_out[0]):
-        for ant in range(0, shape_out[1]):
-            for rec1 in range(0, shape_out[3]):
-                for rec2 in range(0, shape_out[4]):
-                    gain_out[time, ant, :, rec1, rec2] = interpolator.interp(
-                        frequency_out,
-                        frequency_gt,
-                        gain[time, ant, :, rec1, rec2],
-                    )
-    return gain_out
+    return interpolator
 
 
 class PolynomialInterpolator:
-    """fit the data using the numpy polynomial polyfit function
+    """fit the data with least-squares polynomials, as numpy polyfit
+
+    All spectra passed to interp are fitted together, with a single fit
+    matrix per sub-band.
 
     Attributes
     ----------
@@ -350,13 +486,17 @@ class PolynomialInterpolator:
         Update the degree of the fitting polynomial
 
     interp(self, freq_out, freq_in, gain):
-        Do the interpolation for the gain in "gain"
+        Do the interpolation for the gain spectra in "gain"
 
     """
 
     def __init__(self):
         self.edges = None
         self.polydeg = 3
+        # full-band edges completed for the last call to interp
+        self._full_band_edges = None
+        # fit and evaluation matrices from the last call to interp
+        self._fit_matrices = None
 
     def set_edges(self, edges, nfrequency):
         """Provide the start channels of any sub-bands requiring separate fits
@@ -365,18 +505,37 @@ class PolynomialInterpolator:
         :param nfrequency: total number of channels in input spectra
 
         """
-        if edges is None or edges == []:
+        self.edges = self._get_full_band_edges(edges, nfrequency)
+        self._full_band_edges = None
+
+    @staticmethod
+    def _get_full_band_edges(edges, nfrequency):
+        """Append the full-band edge channels to a list of sub-band edges
+
+        :param edges: list of edges in input spectra (starting channel indices)
+        :param nfrequency: total number of channels in input spectra
+        :return: numpy array of edges, starting at 0 and ending at nfrequency
+
+        """
+        if edges is None or len(edges) == 0:
             edges = numpy.array([0, nfrequency])
-            fstr = f"set edges to {edges}"
-            log.debug("set edges to %s", fstr)
+            log.debug("set edges to %s", edges)
+
+        nedges = len(edges)
+        full_band_edges = numpy.empty(nedges + 2, numpy.intp)
+        start = 0
         # ensure that the channel before the first discontinuity are included
         if edges[0] > 0:
-            edges = numpy.concatenate(([0], edges))
+            full_band_edges[0] = 0
+            start = 1
+        full_band_edges[start : start + nedges] = edges
+        end = start + nedges
         # ensure that the channel after the last discontinuity are included
         if edges[-1] < nfrequency:
-            edges = numpy.concatenate((edges, [nfrequency]))
+            full_band_edges[end] = nfrequency
+            end += 1
 
-        self.edges = edges
+        return full_band_edges[:end]
 
     def set_polydeg(self, polydeg):
         """Update the order of the polynomial fit
@@ -393,43 +552,143 @@ class PolynomialInterpolator:
             final frequency values
         :param freq_in: numpy array of shape [len(freq_in)]
             initial frequency values
-        :param gain: numpy array of shape [len(freq_in)]
-            complex sequence to interpolate
-        :return: numpy array of shape [len(freq_out)]
-            interpolated complex sequence
+        :param gain: numpy array of shape [len(freq_in)] or
+            [len(freq_in), nspectra]
+            complex sequence(s) to interpolate, with frequency along the
+            first axis
+        :return: numpy array of shape [len(freq_out)] or
+            [len(freq_out), nspectra]
+            interpolated complex sequence(s)
 
         """
 
-        edges = self.edges
-        if edges is None or len(edges) < 2:
-            self.set_edges(edges, len(freq_in))
-            edges = self.edges
+        edges = self._set_full_band_edges(len(freq_in))
+
+        # work with spectra as columns so that all are fitted together
+        spectra = numpy.ascontiguousarray(gain, "complex128").reshape(
+            len(freq_in), -1
+        )
 
-        idx_out = numpy.arange(0, len(freq_out)).astype("int")
-        gain_out = numpy.empty(len(freq_out), "complex128")
+        gain_out = numpy.empty((len(freq_out), spectra.shape[1]), "complex128")
+
+        for ch_in, ch_out, fit_matrix in self._set_fit_matrices(
+            freq_out, freq_in, edges
+        ):
+            # fit and evaluate the real and imaginary parts of all spectra
+            # with one real matrix product, viewing each complex column as
+            # an interleaved pair of real columns. The product is written
+            # straight into the output rows, which are contiguous, and runs
+            # on the threads of the BLAS library
+            numpy.matmul(
+                fit_matrix,
+                spectra[ch_in].view("float64"),
+                out=gain_out[ch_out].view("float64"),
+            )
+
+        return gain_out.reshape((len(freq_out),) + gain.shape[1:])
+
+    def _set_full_band_edges(self, nfrequency):
+        """Complete the default full-band edges for the input channels
+
+        Edges given to set_edges already include the full-band edge
+        channels. Otherwise the default edges follow the number of input
+        channels, rather than being fixed by the first call, and are kept
+        while that is unchanged. self.edges is left as set.
+
+        :param nfrequency: total number of channels in input spectra
+        :return: numpy array of edges, starting at 0 and ending at nfrequency
+
+        """
+        if self.edges is not None and len(self.edges) >= 2:
+            return self.edges
+
+        if (
+            self._full_band_edges is None
+            or self._full_band_edges[0] != nfrequency
+        ):
+            self._full_band_edges = (
+                nfrequency,
+                self._get_full_band_edges(self.edges, nfrequency),
+            )
+        return self._full_band_edges[1]
+
+    def _set_fit_matrices(self, freq_out, freq_in, edges):
+        """Generate the polynomial fit matrices for each sub-band
+
+        For sub-band k, the least-squares polynomial coefficients of a
+        spectrum y are pinv(V_k) @ y, where V_k is the Vandermonde matrix of
+        the input frequencies, and the fit is evaluated at the output
+        frequencies with their Vandermonde matrix, V_out_k. Both steps are
+        combined into the single matrix V_out_k @ pinv(V_k). These only
+        depend on the frequencies, edges and polynomial degree, so are kept
+        and reused while those are unchanged.
+
+        :param freq_out: numpy array of shape [len(freq_out)]
+            final frequency values, in increasing order
+        :param freq_in: numpy array of shape [len(freq_in)]
+            initial frequency values
+        :param edges: sub-band edges, including the full-band edge channels
+        :return: list of (ch_in, ch_out, V_out_k @ pinv(V_k)) for each
+            sub-band, where ch_in and ch_out are slices of the contiguous
+            input and output channels of the sub-band
 
+        """
+        if self._fit_matrices is not None:
+            key, fit_matrices = self._fit_matrices
+            if (
+                key[0] == self.polydeg
+                and numpy.array_equal(key[1], edges)
+                and numpy.array_equal(key[2], freq_in)
+                and numpy.array_equal(key[3], freq_out)
+            ):
+                return fit_matrices
+
+        fit_matrices = []
         dfreq_in = freq_in[1] - freq_in[0]
         for k in range(0, len(edges) - 1):
-            ch_in = numpy.arange(edges[k], edges[k + 1]).astype("int")
-            ch_out = idx_out[
-                (freq_out >= freq_in[edges[k]] - dfreq_in / 2)
-                * (freq_out < freq_in[edges[k + 1] - 1] + dfreq_in / 2)
-            ]
-
-            # fit the data using polynomials
-            coef_re = polynomial.polyfit(
-                freq_in[ch_in], numpy.real(gain[ch_in]), self.polydeg
+            ch_in = slice(edges[k], edges[k + 1])
+            # pinv gives a minimum-norm fit for underdetermined sub-bands,
+            # so warn as polyfit does
+            if edges[k + 1] - edges[k] <= self.polydeg:
+                warnings.warn(
+                    f"sub-band {k} has {edges[k + 1] - edges[k]} channels, "
+                    f"too few for a degree {self.polydeg} polynomial fit",
+                    numpy.RankWarning,
+                )
+            # output channels within half a channel of the sub-band limits
+            ch_out = slice(
+                numpy.searchsorted(
+                    freq_out, freq_in[edges[k]] - dfreq_in / 2, side="left"
+                ),
+                numpy.searchsorted(
+                    freq_out,
+                    freq_in[edges[k + 1] - 1] + dfreq_in / 2,
+                    side="left",
+                ),
             )
-            coef_im = polynomial.polyfit(
-                freq_in[ch_in], numpy.imag(gain[ch_in]), self.polydeg
+
+            # shift and scale the frequencies to [-1, 1] to keep the
+            # Vandermonde matrices well conditioned
+            centre = numpy.mean(freq_in[ch_in])
+            scale = numpy.amax(numpy.abs(freq_in[ch_in] - centre))
+            if scale == 0:
+                scale = 1.0
+
+            vander_in = polynomial.polyvander(
+                (freq_in[ch_in] - centre) / scale, self.polydeg
+            )
+            vander_out = polynomial.polyvander(
+                (freq_out[ch_out] - centre) / scale, self.polydeg
             )
-            # evaluated the fits at the output frequencies
-            gain_out[ch_out] = (
-                polynomial.polyval(freq_out[ch_out], coef_re)
-                + polynomial.polyval(freq_out[ch_out], coef_im) * 1j
+            fit_matrices.append(
+                (ch_in, ch_out, vander_out @ numpy.linalg.pinv(vander_in))
             )
 
-        return gain_out
+        self._fit_matrices = (
+            (self.polydeg, numpy.copy(edges), freq_in.copy(), freq_out.copy()),
+            fit_matrices,
+        )
+        return fit_matrices
 
 
 # pylint: disable=too-few-public-methods
@@ -441,10 +700,15 @@ class NumpyLinearInterpolator:
     Methods
     -------
     interp(self, freq_out, freq_in, gain):
-        Do the interpolation for the gain in "gain"
+        Do the interpolation for the gain spectra in "gain"
 
     """
 
+    def __init__(self):
+        # input frequencies of the last call to interp and whether their
+        # channels are uniformly spaced
+        self._uniform = None
+
     def interp(self, freq_out, freq_in, gain):
         """Do the interpolation for the complex data in "gain"
 
@@ -452,25 +716,89 @@ class NumpyLinearInterpolator:
             final frequency values
         :param freq_in: numpy array of shape [len(freq_in)]
             initial frequency values
-        :param gain: numpy array of shape [len(freq_in)]
-            complex sequence to interpolate
-        :return: numpy array of shape [len(freq_out)]
-            interpolated complex sequence
+        :param gain: numpy array of shape [len(freq_in)] or
+            [len(freq_in), nspectra]
+            complex sequence(s) to interpolate, with frequency along the
+            first axis
+        :return: numpy array of shape [len(freq_out)] or
+            [len(freq_out), nspectra]
+            interpolated complex sequence(s)
 
         """
-        return numpy.interp(freq_out, freq_in, gain)
+        if gain.ndim == 1:
+            return numpy.interp(freq_out, freq_in, gain)
+
+        if len(freq_in) == 1:
+            return numpy.repeat(gain, len(freq_out), axis=0)
+
+        # Find the pair of input channels either side of each output channel
+        # and interpolate all spectra at once, clamping at the band edges as
+        # numpy.interp does
+        dfreq_in = freq_in[1] - freq_in[0]
+        if self._is_uniform(freq_in):
+            # uniform input channels, so the index follows directly
+            chan = (freq_out - freq_in[0]) / dfreq_in
+            idx = numpy.clip(
+                numpy.floor(chan).astype(numpy.intp), 0, len(freq_in) - 2
+            )
+            weight = numpy.clip(chan - idx, 0.0, 1.0)
+        else:
+            idx = numpy.clip(
+                numpy.searchsorted(freq_in, freq_out, side="right") - 1,
+                0,
+                len(freq_in) - 2,
+            )
+            weight = numpy.clip(
+                (freq_out - freq_in[idx]) / (freq_in[idx + 1] - freq_in[idx]),
+                0.0,
+                1.0,
+            )
+        return (
+            gain[idx] + (gain[idx + 1] - gain[idx]) * weight[:, numpy.newaxis]
+        )
+
+    def _is_uniform(self, freq_in):
+        """Check whether the input channels are uniformly spaced
+
+        Any drift in the spacing accumulates in channel indices calculated
+        from the first spacing, so the spacings must agree to within
+        rounding rather than a relative tolerance. The result only depends
+        on the input frequencies, so is kept and reused while they are
+        unchanged.
+
+        :param freq_in: numpy array of shape [len(freq_in)], with
+            len(freq_in) > 1
+            initial frequency values
+        :return: True if the channels are uniformly spaced
+
+        """
+        if self._uniform is not None and numpy.array_equal(
+            self._uniform[0], freq_in
+        ):
+            return self._uniform[1]
+
+        dfreq_in = freq_in[1] - freq_in[0]
+        uniform = bool(
+            numpy.abs(numpy.diff(freq_in) - dfreq_in).max()
+            <= 1e-9 * abs(dfreq_in)
+        )
+        self._uniform = (freq_in.copy(), uniform)
+        return uniform
 
 
 # pylint: disable=too-few-public-methods
 # this class is simple, but keep its form consistent with other interpolators
 # more interpolator-specific functionality may also need to be added
 class ScipySplineInterpolator:
-    """fit the data using the scipy interpolate CubicSpline function
+    """fit the data using a scipy interpolate cubic spline
+
+    The spline is generated with make_interp_spline, using the same
+    not-a-knot boundary conditions as CubicSpline.
 
     Methods
     -------
     interp(self, freq_out, freq_in, gain):
-        Do the interpolation for the gain in "gain"
+        Do the interpolation for the gain spectra in "gain"
 
     """
 
@@ -481,11 +809,21 @@ class ScipySplineInterpolator:
             final frequency values
         :param freq_in: numpy array of shape [len(freq_in)]
             initial frequency values
-        :param gain: numpy array of shape [len(freq_in)]
-            complex sequence to interpolate
-        :return: numpy array of shape [len(freq_out)]
-            interpolated complex sequence
+        :param gain: numpy array of shape [len(freq_in)] or
+            [len(freq_in), nspectra]
+            complex sequence(s) to interpolate, with frequency along the
+            first axis
+        :return: numpy array of shape [len(freq_out)] or
+            [len(freq_out), nspectra]
+            interpolated complex sequence(s)
 
         """
-        func = interpolate.CubicSpline(freq_in, gain)
-        return func(freq_out)
+        # Fit all spectra along the frequency axis with a single spline, so
+        # that the collocation matrix is factorised once for all of them.
+        # This scales better than applying a dense [len(freq_out),
+        # len(freq_in)] evaluation matrix, for all but the shortest spectra.
+        # Reduce the order for short spectra, as CubicSpline does
+        spline = interpolate.make_interp_spline(
+            freq_in, gain, k=min(3, len(freq_in) - 1), axis=0
+        )
+        return spline(freq_out)
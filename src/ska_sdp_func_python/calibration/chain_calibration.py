@@ -18,6 +18,10 @@ from ska_sdp_datamodels.calibration.calibration_create import (
 )
 from ska_sdp_datamodels.calibration.calibration_model import GainTable
 
+from ska_sdp_func_python.calibration.beamformer_utils import (
+    _multiply_gaintable_jones_array,
+    _set_gaintable_product_shape,
+)
 from ska_sdp_func_python.calibration.operations import apply_gaintable
 from ska_sdp_func_python.calibration.solvers import solve_gaintable
 
@@ -79,6 +83,7 @@ def apply_calibration_chain(
     controls=None,
     iteration=0,
     inverse=True,
+    fuse=False,
 ):
     """
     Update the Visibility using the calibrated solutions
@@ -98,6 +103,11 @@ def apply_calibration_chain(
                     to the 'first_selfcal' field.
     :param inverse: The inverse operation of applying a gain table
                     to a visibility
+    :param fuse: Multiply the GainTables of all contexts being applied
+                 into one, and apply that in a single pass over the
+                 visibilities. This is only done for GainTables with the
+                 same times and diagonal Jones matrices; otherwise they are
+                 applied in turn. Default is False
     :return: Visibility after calibration solution applied
              Or return original visibility if the GainTables provided
              don't match the calibration context.
@@ -132,13 +142,87 @@ def apply_calibration_chain(
     # Only apply if the context list is not empty
     # else return the original Visibility
     if contexts:
+        contexts = [
+            c for c in contexts if iteration >= controls[c]["first_selfcal"]
+        ]
+        if fuse and len(contexts) > 1:
+            gain_table = _multiply_gaintable_chain([gt[c] for c in contexts])
+            if gain_table is not None:
+                return apply_gaintable(vis, gain_table, inverse=inverse)
+
         for c in contexts:
-            if iteration >= controls[c]["first_selfcal"]:
-                vis = apply_gaintable(vis, gt[c], inverse=inverse)
+            vis = apply_gaintable(vis, gt[c], inverse=inverse)
 
     return vis
 
 
+def _multiply_gaintable_chain(gaintables):
+    """
+    Multiply a chain of GainTables into a single GainTable.
+
+    apply_gaintable applies the Jones matrices of each baseline as
+    J_1 V J_2^*, so applying the product of a chain of GainTables only
+    matches applying them in turn if their Jones matrices commute. This is
+    ensured by only multiplying GainTables with diagonal Jones matrices,
+    for which the order, and whether their inverses are applied, does not
+    matter.
+
+    The Jones matrices are multiplied as arrays, and a single GainTable is
+    made for the product at the end.
+
+    :param gaintables: List of GainTables
+    :return: GainTable, or None if the GainTables have different times,
+             are not diagonal or cannot be multiplied
+    """
+    for gaintable in gaintables:
+        if gaintable.jones_type == "K":
+            return None
+        if not (
+            numpy.array_equal(gaintable.time.data, gaintables[0].time.data)
+            and numpy.array_equal(
+                gaintable.interval.data, gaintables[0].interval.data
+            )
+        ):
+            return None
+        gain = gaintable.gain.data
+        if gain.shape[-1] > 1 and (
+            numpy.any(gain[..., 0, 1] != 0.0)
+            or numpy.any(gain[..., 1, 0] != 0.0)
+        ):
+            return None
+
+    try:
+        gain = gaintables[0].gain.data
+        for gaintable in gaintables[1:]:
+            _set_gaintable_product_shape(gaintables[0], gaintable)
+            gain = _multiply_gaintable_jones_array(gain, gaintable.gain.data)
+    except ValueError as err:
+        log.debug("apply_calibration_chain: cannot fuse GainTables: %s", err)
+        return None
+
+    # Take the frequencies from a table with the full number of channels,
+    # noting that some tables may have only one
+    freq_table = max(gaintables, key=lambda g: g.gain.shape[2])
+
+    # If the tables have the same jones_type use that
+    # Otherwise assume a general form and use B
+    jones_types = {gaintable.jones_type for gaintable in gaintables}
+    jones_type = jones_types.pop() if len(jones_types) == 1 else "B"
+
+    return GainTable.constructor(
+        gain=gain,
+        time=gaintables[0].time.data,
+        interval=gaintables[0].interval.data,
+        weight=freq_table.weight.data,
+        residual=freq_table.residual.data,
+        frequency=freq_table.frequency.data,
+        receptor_frame=gaintables[0].receptor_frame1,
+        phasecentre=gaintables[0].phasecentre,
+        configuration=gaintables[0].configuration,
+        jones_type=jones_type,
+    )
+
+
 def calibrate_chain(
     vis,
     model_vis,
@@ -274,6 +358,10 @@ def solve_calibrate_chain(
     elif isinstance(gaintables, dict):
         gt = gaintables
 
+    # The data and model are the same for every Jones matrix, so only check
+    # once whether they are non-zero, when first needed
+    have_data = None
+
     for c in list(calibration_context):
         if c not in gt.keys():
             gt[c] = create_gaintable_from_visibility(
@@ -282,11 +370,11 @@ def solve_calibrate_chain(
         fmin = gt[c].frequency.data[0]
         fmax = gt[c].frequency.data[-1]
         if iteration >= controls[c]["first_selfcal"]:
-            if numpy.max(
-                numpy.abs(vis.visibility_acc.flagged_weight)
-            ) > 0.0 and (
-                amvis is None or numpy.max(numpy.abs(amvis.vis)) > 0.0
-            ):
+            if have_data is None:
+                have_data = numpy.any(
+                    vis.visibility_acc.flagged_weight != 0.0
+                ) and (amvis is None or numpy.any(amvis.vis.data != 0.0))
+            if have_data:
                 gt[c] = solve_gaintable(
                     avis,
                     amvis,
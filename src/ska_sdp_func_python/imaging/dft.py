@@ -16,13 +16,13 @@ import logging
 from typing import List, Union
 
 import numpy
-from scipy import interpolate
 from ska_sdp_datamodels.science_data_model.polarisation_functions import (
     convert_pol_frame,
 )
 from ska_sdp_datamodels.sky_model.sky_model import SkyComponent
 from ska_sdp_datamodels.visibility.vis_model import Visibility
 
+from ska_sdp_func_python.util.array_functions import interpolate_spectrum
 from ska_sdp_func_python.util.coordinate_support import skycoord_to_lmn
 from ska_sdp_func_python.visibility.base import calculate_visibility_phasor
 
@@ -92,12 +92,11 @@ def extract_direction_and_flux(sc, vis):
             nvchan = len(vis.frequency)
             vflux = numpy.zeros([nvchan, npol])
             if nchan > 1:
-                # TODO: this path needs testing to verify that it works
-                for pol in range(flux.shape[1]):
-                    fint = interpolate.interp1d(
-                        comp.frequency, comp.flux[:, pol], kind="cubic"
-                    )
-                    vflux[:, pol] = fint(vis.frequency.data)
+                # Fit all polarisations at once. Frequencies outside the
+                # component's range are an error, not extrapolated
+                vflux[...] = interpolate_spectrum(
+                    numpy.asarray(comp.frequency), flux, vis.frequency.data
+                )
             else:
                 # Just take the value since we cannot interpolate.
                 # Might want to put some test here
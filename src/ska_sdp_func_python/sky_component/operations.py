@@ -38,7 +38,6 @@ from astropy.modeling import fitting, models
 from astropy.stats import gaussian_fwhm_to_sigma
 from astropy.wcs.utils import pixel_to_skycoord, skycoord_to_pixel
 from photutils import segmentation
-from scipy import interpolate
 from scipy.optimize import minpack
 from scipy.spatial import Voronoi  # pylint: disable=no-name-in-module
 from ska_sdp_datamodels.image.image_model import Image
@@ -57,6 +56,7 @@ from ska_sdp_func_python.util.array_functions import (
     insert_function_L,
     insert_function_pswf,
     insert_function_sinc,
+    interpolate_spectrum,
 )
 
 log = logging.getLogger("func-python-logger")
@@ -627,11 +627,9 @@ def insert_skycomponent(
         flux = numpy.zeros([nchan, npol])
 
         if comp.flux.shape[0] > 1:
-            for pol in range(npol):
-                fint = interpolate.interp1d(
-                    comp.frequency.data, comp.flux[:, pol], kind="cubic"
-                )
-                flux[:, pol] = fint(image_frequency)
+            flux[...] = interpolate_spectrum(
+                comp.frequency.data, comp.flux, image_frequency
+            )
         else:
             flux = comp.flux
 
@@ -712,11 +710,9 @@ def restore_skycomponent(
         ):
             flux = comp.flux
         elif comp.flux.shape[0] > 1:
-            for pol in range(npol):
-                fint = interpolate.interp1d(
-                    comp.frequency.data, comp.flux[:, pol], kind="cubic"
-                )
-                flux[:, pol] = fint(image_frequency)
+            flux[...] = interpolate_spectrum(
+                comp.frequency.data, comp.flux, image_frequency
+            )
         else:
             flux = comp.flux
 
@@ -10,9 +10,11 @@ __all__ = [
     "insert_function_L",
     "insert_function_pswf",
     "insert_function_sinc",
+    "interpolate_spectrum",
 ]
 
 import numpy
+from scipy import interpolate
 
 from ska_sdp_func_python.fourier_transforms.fft_coordinates import grdsf
 
@@ -176,3 +178,31 @@ def insert_array(
             )
 
     return im
+
+
+def interpolate_spectrum(frequency, spectrum, new_frequency):
+    """Interpolate spectra to new frequencies with a spline
+
+    All spectra are fitted at once, with a cubic spline where there are
+    enough frequencies and a lower degree otherwise. Frequencies outside
+    the range of the spectra are an error rather than being extrapolated.
+
+    :param frequency: Frequencies (Hz) of the spectra, in increasing order,
+        with len(frequency) > 1
+    :param spectrum: Spectra, of shape [len(frequency), ...]
+    :param new_frequency: Frequencies (Hz) to interpolate to
+    :return: numpy array of shape [len(new_frequency), ...]
+    """
+    if (
+        numpy.min(new_frequency) < frequency[0]
+        or numpy.max(new_frequency) > frequency[-1]
+    ):
+        raise ValueError(
+            f"Frequencies {numpy.min(new_frequency)} to "
+            f"{numpy.max(new_frequency)} Hz are outside the range "
+            f"{frequency[0]} to {frequency[-1]} Hz"
+        )
+    fint = interpolate.make_interp_spline(
+        frequency, spectrum, k=min(3, len(frequency) - 1), axis=0
+    )
+    return fint(new_frequency)
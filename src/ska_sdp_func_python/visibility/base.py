@@ -40,7 +40,12 @@ def calculate_visibility_phasor(direction, vis):
     phasor[...] = numpy.exp(
         -2j
         * numpy.pi
-        * numpy.einsum("tbfs,s->tbf", vis.visibility_acc.uvw_lambda.data, s)
+        * numpy.einsum(
+            "tbfs,s->tbf",
+            vis.visibility_acc.uvw_lambda.data,
+            s,
+            optimize=True,
+        )
     )[..., numpy.newaxis]
     return phasor
 
@@ -14,7 +14,10 @@ from ska_sdp_datamodels.calibration.calibration_create import (
 )
 
 from ska_sdp_func_python.calibration.beamformer_utils import (
+    NumpyLinearInterpolator,
+    PolynomialInterpolator,
     expand_delay_phase,
+    get_bandpass_interpolator,
     multiply_gaintable_jones,
     resample_bandpass,
     set_beamformer_frequencies,
@@ -72,6 +75,45 @@ def test_expand_delay_phase():
     ).all()
 
 
+def test_expand_delay_phase_absolute():
+    """
+    Test expand_delay_phase
+
+    Without reference_to_centre the phase shifts are proportional to the
+    absolute frequency, so match the input phases at the reference frequency.
+    """
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=5, ntimes=4
+    )
+
+    jones_type = "G"
+    gt = create_gaintable_from_visibility(vis, jones_type=jones_type)
+
+    gtK = simulate_gaintable(
+        gt,
+        phase_error=0.1,
+        amplitude_error=0.0,
+        leakage=0.0,
+    )
+    gtK["jones_type"] = "K"
+
+    frequency = numpy.concatenate((gtK.frequency.data, vis.frequency.data))
+    gtB = expand_delay_phase(gtK, frequency, reference_to_centre=False)
+    assert gtB.gain.shape[2] == len(frequency)
+
+    freq0 = gtK.frequency.data[0]
+    ratio = frequency.reshape(1, 1, -1, 1, 1) / freq0
+    phases = numpy.exp(1j * ratio * numpy.angle(gtK["gain"].data))
+    assert (numpy.abs(gtB["gain"].data - phases) < 1e-12).all()
+    assert (
+        numpy.abs(
+            gtB["gain"].data[:, :, 0]
+            - numpy.exp(1j * numpy.angle(gtK["gain"].data[:, :, 0]))
+        )
+        < 1e-12
+    ).all()
+
+
 def test_multiply_gaintable_jones_GB():
     """
     Test multiply_gaintable_jones
@@ -176,6 +218,88 @@ def test_multiply_gaintable_jones_BD():
     assert numpy.array_equal(J1 @ J2, J)
 
 
+def test_multiply_gaintable_jones_elementwise():
+    """
+    Test multiply_gaintable_jones
+
+    Check the elementwise multiplication of full-band G with spectral B
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=5, ntimes=4
+    )
+
+    jones_type = "G"
+    gt1 = create_gaintable_from_visibility(vis, jones_type=jones_type)
+    assert gt1.frequency.shape[0] == 1
+
+    jones_type = "B"
+    gt2 = create_gaintable_from_visibility(vis, jones_type=jones_type)
+    assert gt2.frequency.shape[0] == 5
+
+    gt1 = simulate_gaintable(
+        gt1,
+        phase_error=0.1,
+        amplitude_error=0.1,
+        leakage=0.1,
+    )
+
+    gt2 = simulate_gaintable(
+        gt2,
+        phase_error=0.1,
+        amplitude_error=0.1,
+        leakage=0.1,
+    )
+
+    gt = multiply_gaintable_jones(gt1, gt2, elementwise=True)
+    assert gt.frequency.shape[0] == 5
+
+    for chan in range(5):
+        assert numpy.array_equal(
+            gt1.gain.data[:, :, 0] * gt2.gain.data[:, :, chan],
+            gt.gain.data[:, :, chan],
+        )
+
+
+def test_gaintable_jones_complex64():
+    """
+    Test expand_delay_phase and multiply_gaintable_jones
+
+    Check that single-precision gain tables stay single precision, and
+    that expand_delay_phase can also produce them from double precision
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=5, ntimes=4
+    )
+
+    jones_type = "G"
+    gtK = create_gaintable_from_visibility(vis, jones_type=jones_type)
+    gtK = simulate_gaintable(
+        gtK,
+        phase_error=0.1,
+        amplitude_error=0.0,
+        leakage=0.0,
+    )
+    gtK["jones_type"] = "K"
+    gtK["gain"] = gtK["gain"].astype("complex64")
+
+    gtB = expand_delay_phase(gtK, vis.frequency.data)
+    assert gtB.gain.dtype == "complex64"
+
+    gt = multiply_gaintable_jones(gtB, gtB)
+    assert gt.gain.dtype == "complex64"
+
+    J = gtB.gain.data[2, 5, 3]
+    assert numpy.allclose(gt.gain.data[2, 5, 3], J @ J, atol=1e-6)
+
+    # expand double-precision delays to single-precision gains
+    gtK["gain"] = gtK["gain"].astype("complex128")
+    gt64 = expand_delay_phase(gtK, vis.frequency.data, dtype="complex64")
+    assert gt64.gain.dtype == "complex64"
+    assert numpy.allclose(gt64.gain.data, gtB.gain.data, atol=1e-6)
+
+
 def test_set_beamformer_frequencies_low():
     """
     Test set_beamformer_frequencies (SKA-Low)
@@ -198,6 +322,56 @@ def test_set_beamformer_frequencies_low():
     assert frequency[-1] <= vis.frequency[-1]
 
 
+def test_set_beamformer_frequencies_low_edges():
+    """
+    Test set_beamformer_frequencies (SKA-Low) for input band edges on the
+    station channel grid
+
+    Check that both edge channels are kept and that the output channels
+    sit exactly on the grid.
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=5, ntimes=4
+    )
+    vis["frequency"] = 781.25e3 * (128 + 2 * numpy.arange(0, 5))
+
+    jones_type = "B"
+    gt = create_gaintable_from_visibility(vis, jones_type=jones_type)
+
+    frequency = set_beamformer_frequencies(gt)
+    assert len(frequency) == 9
+    assert numpy.array_equal(frequency, 781.25e3 * (128 + numpy.arange(9)))
+
+
+def test_set_beamformer_frequencies_mid_edges():
+    """
+    Test set_beamformer_frequencies (SKA-Mid) for a last input channel on
+    the beamformer channel grid
+
+    The input frequencies come from linspace, so the last channel is only
+    on the grid to within rounding. Check that it is still kept.
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=100, ntimes=4
+    )
+
+    dfrequency_bf = 300.0e6 / 4096
+    nchan_bf = 364
+    start = 1.0e9 * numpy.pi / 3
+    vis["frequency"] = numpy.linspace(
+        start, start + (nchan_bf - 1) * dfrequency_bf, 100
+    )
+
+    jones_type = "B"
+    gt = create_gaintable_from_visibility(vis, jones_type=jones_type)
+
+    frequency = set_beamformer_frequencies(gt, array="MID")
+    assert len(frequency) == nchan_bf
+    assert numpy.abs(frequency[-1] - vis.frequency.data[-1]) < 1e-3
+
+
 def test_set_beamformer_frequencies_mid():
     """
     Test set_beamformer_frequencies (SKA-Mid)
@@ -258,3 +432,179 @@ def test_resample_bandpass():
     assert (numpy.abs(gainfit1[time, ant, :, 0, 0] - gaintrue) < 1e-4).all()
     assert (numpy.abs(gainfit2[time, ant, :, 0, 0] - gaintrue) < 1e-4).all()
     assert (numpy.abs(gainfit3[time, ant, :, 0, 0] - gaintrue) < 1e-2).all()
+
+
+def test_resample_bandpass_multiple_spectra():
+    """
+    Test resample_bandpass
+
+    Set different analytic functions for spectra of different times,
+    antennas and receptors, and check that each is resampled independently.
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=5, ntimes=4
+    )
+
+    jones_type = "B"
+    gt = create_gaintable_from_visibility(vis, jones_type=jones_type)
+
+    frequency = set_beamformer_frequencies(gt)
+
+    gt["gain"].data[2, 5, :, 0, 0] = _resample_func(gt.frequency.data)
+    gt["gain"].data[1, 3, :, 1, 0] = 0.5 * _resample_func(-gt.frequency.data)
+
+    for alg in ["polyfit", "cubicspl", "interp"]:
+        gainfit = resample_bandpass(frequency, gt, alg=alg)
+        assert gainfit.shape == (
+            gt.gain.shape[0],
+            gt.gain.shape[1],
+            len(frequency),
+            gt.gain.shape[3],
+            gt.gain.shape[4],
+        )
+        tol = 1e-2 if alg == "interp" else 1e-4
+        assert (
+            numpy.abs(gainfit[2, 5, :, 0, 0] - _resample_func(frequency)) < tol
+        ).all()
+        assert (
+            numpy.abs(
+                gainfit[1, 3, :, 1, 0] - 0.5 * _resample_func(-frequency)
+            )
+            < tol
+        ).all()
+
+
+def test_resample_bandpass_edges():
+    """
+    Test resample_bandpass with sub-band edges
+
+    Set a spectrum with a discontinuity and check that fitting either side of
+    it separately recovers both analytic functions.
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=16, ntimes=4
+    )
+
+    jones_type = "B"
+    gt = create_gaintable_from_visibility(vis, jones_type=jones_type)
+
+    frequency = set_beamformer_frequencies(gt)
+
+    time = 2
+    ant = 5
+    edge = 8
+    frequency_gt = gt.frequency.data
+    gt["gain"].data[time, ant, :edge, 0, 0] = _resample_func(
+        frequency_gt[:edge]
+    )
+    gt["gain"].data[time, ant, edge:, 0, 0] = 0.5 * _resample_func(
+        -frequency_gt[edge:]
+    )
+
+    gainfit = resample_bandpass(frequency, gt, alg="polyfit", edges=[edge])
+
+    lower = frequency < (frequency_gt[edge - 1] + frequency_gt[edge]) / 2
+    assert lower.any() and not lower.all()
+    assert (
+        numpy.abs(
+            gainfit[time, ant, lower, 0, 0] - _resample_func(frequency[lower])
+        )
+        < 1e-4
+    ).all()
+    assert (
+        numpy.abs(
+            gainfit[time, ant, ~lower, 0, 0]
+            - 0.5 * _resample_func(-frequency[~lower])
+        )
+        < 1e-4
+    ).all()
+
+
+@pytest.mark.parametrize("alg", ["polyfit", "interp", "cubicspl"])
+def test_resample_bandpass_interpolator(alg):
+    """
+    Test resample_bandpass with an interpolator reused across calls
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [1.0, 0.0, 0.0, 0.0], nchan=16, ntimes=4
+    )
+    gt = create_gaintable_from_visibility(vis, jones_type="B")
+    frequency = set_beamformer_frequencies(gt)
+
+    interpolator = get_bandpass_interpolator(len(gt.frequency), alg=alg)
+    for scale in [1.0, 2.0]:
+        gt["gain"].data[..., 0, 0] = scale * _resample_func(gt.frequency.data)
+        gainfit = resample_bandpass(frequency, gt, interpolator=interpolator)
+        assert numpy.array_equal(
+            gainfit, resample_bandpass(frequency, gt, alg=alg)
+        )
+
+
+def test_polynomial_interpolator_default_edges():
+    """
+    Test that the PolynomialInterpolator default edges follow each call
+
+    The full-band edges are completed for each number of input channels,
+    without changing the edges attribute.
+    """
+
+    interpolator = PolynomialInterpolator()
+    for nchan in [16, 32, 16]:
+        freq_in = numpy.linspace(1.0e8, 1.1e8, nchan)
+        freq_out = numpy.linspace(1.0e8, 1.1e8, 3 * nchan)
+        gainfit = interpolator.interp(
+            freq_out, freq_in, _resample_func(freq_in)
+        )
+        assert interpolator.edges is None
+        assert (numpy.abs(gainfit - _resample_func(freq_out)) < 1e-3).all()
+
+
+def test_polynomial_interpolator_short_sub_band():
+    """
+    Test that PolynomialInterpolator warns for sub-bands with too few
+    channels for the polynomial degree
+    """
+
+    freq_in = numpy.linspace(1.0e8, 1.1e8, 16)
+    freq_out = numpy.linspace(1.0e8, 1.1e8, 48)
+    interpolator = PolynomialInterpolator()
+    interpolator.set_edges([2], len(freq_in))
+    with pytest.warns(numpy.RankWarning):
+        interpolator.interp(freq_out, freq_in, _resample_func(freq_in))
+
+
+def test_numpy_linear_interpolator_drifting_grid():
+    """
+    Test NumpyLinearInterpolator against numpy.interp for a uniform grid
+    and for a near-uniform grid whose channel spacing slowly drifts
+
+    The same interpolator is used for both grids, which must not reuse the
+    uniformity of the first.
+    """
+
+    nchan = 4096
+    dfreq = 5.4e3
+    uniform = 1.0e8 + dfreq * numpy.arange(nchan)
+    drifting = 1.0e8 + numpy.concatenate(
+        (
+            [0.0],
+            numpy.cumsum(dfreq * (1 + 9e-6 * numpy.arange(nchan - 1) / nchan)),
+        )
+    )
+    interpolator = NumpyLinearInterpolator()
+    for freq_in in [uniform, drifting, uniform]:
+        freq_out = numpy.linspace(freq_in[0], freq_in[-1], 3 * nchan + 1)
+        gain = numpy.stack(
+            [_resample_func(freq_in), _resample_func(2 * freq_in)], axis=1
+        )
+        gainfit = interpolator.interp(freq_out, freq_in, gain)
+        for spectrum in range(gain.shape[1]):
+            assert numpy.allclose(
+                gainfit[:, spectrum],
+                numpy.interp(freq_out, freq_in, gain[:, spectrum]),
+                rtol=0.0,
+                atol=1e-9,
+            )
@@ -12,7 +12,11 @@ from ska_sdp_datamodels.calibration.calibration_create import (
 pytest.importorskip(
     modname="ska_sdp_func", reason="ska-sdp-func is an optional dependency"
 )
+from ska_sdp_func_python.calibration.beamformer_utils import (
+    multiply_gaintable_jones,
+)
 from ska_sdp_func_python.calibration.chain_calibration import (
+    _multiply_gaintable_chain,
     apply_calibration_chain,
     calibrate_chain,
     create_calibration_controls,
@@ -62,6 +66,76 @@ def test_apply_calibration_chain(context):
         assert numpy.array_equal(original["vis"].data, new_vis["vis"].data)
 
 
+@pytest.mark.parametrize("inverse", [True, False])
+@pytest.mark.parametrize("leakage", [0.0, 0.1])
+def test_apply_calibration_chain_fuse(inverse, leakage):
+    """
+    Test that applying the product of a chain of GainTables in one pass
+    matches applying them in turn
+
+    GainTables with leakage terms cannot be fused, and are applied in turn.
+    """
+
+    vis = vis_with_component_data(
+        "stokesIQUV", "linear", [100.0, 0.0, 0.0, 0.0]
+    )
+    gaintables = {}
+    for jones_type, error in [("T", 0.1), ("G", 0.3)]:
+        gaintables[jones_type] = simulate_gaintable(
+            create_gaintable_from_visibility(vis, jones_type=jones_type),
+            phase_error=error,
+            amplitude_error=error,
+            leakage=leakage,
+        )
+    # simulate_gaintable always uses the same seed, so shift the G terms to
+    # other antennas, to make sure that the tables really differ
+    gaintables["G"]["gain"].data = numpy.roll(
+        gaintables["G"]["gain"].data, 1, axis=1
+    )
+    assert not numpy.allclose(
+        gaintables["T"]["gain"].data, gaintables["G"]["gain"].data
+    )
+
+    # the tables are only fused if they are diagonal
+    gain_table = _multiply_gaintable_chain([gaintables["T"], gaintables["G"]])
+    assert (gain_table is None) == (leakage > 0.0)
+
+    controls = create_calibration_controls()
+
+    sequential = apply_calibration_chain(
+        vis.copy(deep=True),
+        gaintables,
+        calibration_context="TG",
+        controls=controls,
+        inverse=inverse,
+    )
+    fused = apply_calibration_chain(
+        vis.copy(deep=True),
+        gaintables,
+        calibration_context="TG",
+        controls=controls,
+        inverse=inverse,
+        fuse=True,
+    )
+
+    assert not numpy.array_equal(vis["vis"].data, fused["vis"].data)
+    assert numpy.allclose(
+        sequential["vis"].data, fused["vis"].data, atol=1e-10
+    )
+
+    if leakage > 0.0:
+        # the product of non-diagonal tables does not match applying them
+        # in turn, which is why they are not fused
+        product = apply_gaintable(
+            vis.copy(deep=True),
+            multiply_gaintable_jones(gaintables["T"], gaintables["G"]),
+            inverse=inverse,
+        )
+        assert not numpy.allclose(
+            sequential["vis"].data, product["vis"].data, atol=1e-10
+        )
+
+
 @pytest.mark.parametrize(
     "context, phase_only, first_selfcal_value",
     [
@@ -41,7 +41,7 @@ def skycomponent():
     f = [100.0, 50.0, -10.0, 40.0]
 
     flux = numpy.outer(
-        numpy.array([numpy.power(freq / 1e8, -0.7) for freq in frequency]),
+        numpy.power(frequency / 1e8, -0.7),
         f,
     )
 
@@ -67,7 +67,7 @@ def skycomponent_phase_center():
     f = [1.0, 0.0, 0.0, 0.0]
 
     flux = numpy.outer(
-        numpy.array([numpy.power(freq / 1e8, -0.7) for freq in frequency]),
+        numpy.power(frequency / 1e8, -0.7),
         f,
     )
 
@@ -124,10 +124,7 @@ def test_create_parset_from_context(visibility):
     Only run this test if DP3 is available.
     """
 
-    calibration_context_list = []
-    calibration_context_list.append("T")
-    calibration_context_list.append("G")
-    calibration_context_list.append("B")
+    calibration_context_list = ["T", "G", "B"]
 
     global_solution = True
 
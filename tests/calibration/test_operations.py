@@ -89,6 +89,38 @@ def test_apply_gaintable(input_params):
     assert (result["weight"].data == vis["weight"].data / 2).all()
 
 
+def test_apply_gaintable_inverse_singular(input_params):
+    """
+    Unit test for apply_gaintable with the inverse of full-polarisation
+    gains, where one antenna has singular Jones matrices
+
+    The visibilities and weights of that antenna's baselines are zeroed,
+    and the other baselines are corrected.
+    """
+    vis = input_params["visibility1"].copy(deep=True)
+    vis["vis"].data[...] = 1.0 + 0.5j
+    vis["weight"].data[...] = 1.0
+    original = vis["vis"].data.copy()
+
+    gain_table = create_gaintable_from_visibility(vis)
+    gain_table["gain"].data[..., 0, 0] = 2.0
+    gain_table["gain"].data[..., 1, 1] = 2.0
+    singular_ant = 3
+    gain_table["gain"].data[:, singular_ant, ...] = 0.0
+
+    result = apply_gaintable(vis, gain_table, inverse=True)
+
+    ant_pairs = numpy.array(vis.baselines.data.tolist())
+    singular = (ant_pairs == singular_ant).any(axis=1)
+    assert singular.any() and not singular.all()
+    assert (result["vis"].data[:, singular] == 0.0).all()
+    assert (result["weight"].data[:, singular] == 0.0).all()
+    numpy.testing.assert_allclose(
+        result["vis"].data[:, ~singular], original[:, ~singular] / 4.0
+    )
+    assert (result["weight"].data[:, ~singular] == 1.0).all()
+
+
 def test_multiply_gaintables(input_params):
     """
     Unit test for the multiply_gaintable function
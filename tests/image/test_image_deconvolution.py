@@ -3,6 +3,7 @@ Unit tests for image deconvolution
 """
 import numpy
 import pytest
+from numpy.random import default_rng
 from ska_sdp_datamodels.image.image_create import create_image
 from ska_sdp_datamodels.science_data_model.polarisation_model import (
     PolarisationFrame,
@@ -27,9 +28,6 @@ from ska_sdp_func_python.imaging.imaging import (
 @pytest.fixture(scope="module", name="predicted_vis")
 def predicted_vis_fixture(visibility_deconv):
     """Pytest fixture for the deconvolution.py unit tests"""
-    # pylint: disable=import-outside-toplevel
-    from numpy.random import default_rng
-
     rng = default_rng(1805550721)
 
     vis = visibility_deconv.copy(deep=True, zero=True)
@@ -15,12 +15,19 @@ from ska_sdp_func_python.image.taylor_terms import (
     calculate_image_list_frequency_moments,
     calculate_image_list_from_frequency_taylor_terms,
 )
+from tests.testing_utils import env_flag
 
 
 @pytest.fixture(scope="module", name="input_params")
 def taylor_terms_fixture():
-    """Fixture for the taylor_terms.py unit tests"""
-    npixel = 512
+    """Fixture for the taylor_terms.py unit tests
+
+    None of the functions tested write to their input images, so the
+    image is shared by all tests
+    """
+    # FUNC_PYTHON_FAST=1 selects smaller images
+    fast = env_flag("FUNC_PYTHON_FAST")
+    npixel = 128 if fast else 512
     cellsize = 0.00015
     phase_centre = SkyCoord(
         ra=+180.0 * units.deg,
@@ -38,7 +45,7 @@ def test_calculate_image_frequency_moments_3(input_params):
     with 3 moments
     """
     original_cube = input_params["image"]
-    cube = create_image(512, 0.0001, input_params["phasecentre"])
+    cube = input_params["image"]
     moment_cube = calculate_image_frequency_moments(cube, nmoment=3)
     reconstructed_cube = calculate_image_from_frequency_taylor_terms(
         cube, moment_cube
@@ -54,7 +61,7 @@ def test_calculate_image_frequency_moments_1(input_params):
     with 1 moment
     """
     original_cube = input_params["image"]
-    cube = create_image(512, 0.0001, input_params["phasecentre"])
+    cube = input_params["image"]
     moment_cube = calculate_image_frequency_moments(cube, nmoment=1)
     reconstructed_cube = calculate_image_from_frequency_taylor_terms(
         cube, moment_cube
@@ -198,3 +198,40 @@ def test_extract_direction_and_flux_diff_pol(visibility, component):
 
     assert_array_almost_equal(result_direction, expected_direction)
     assert (result_flux == expected_flux).all()
+
+
+def _spectral_component(component, frequency):
+    """
+    Copy of component with a flux linear in frequency, which the
+    cubic spline interpolation reproduces exactly
+    """
+    return SkyComponent(
+        direction=component.direction,
+        frequency=frequency,
+        flux=numpy.outer(frequency / 1e8, [1.0, 0.0, 0.0, 1.0]),
+        polarisation_frame=component.polarisation_frame,
+    )
+
+
+def test_extract_direction_and_flux_interpolate(visibility, component):
+    """
+    comp has more channels than vis, spanning the vis frequencies
+    --> expected flux is the comp flux at the vis frequencies
+    """
+    comp = _spectral_component(component, numpy.linspace(0.9e8, 1.2e8, 7))
+    _, result_flux = extract_direction_and_flux(comp, visibility)
+
+    expected_flux = numpy.outer(
+        visibility.frequency.data / 1e8, [1.0, 0.0, 0.0, 1.0]
+    )
+    assert_allclose(result_flux[0], expected_flux, atol=1e-12)
+
+
+def test_extract_direction_and_flux_out_of_band(visibility, component):
+    """
+    vis frequencies extend below the comp frequencies
+    --> ValueError rather than an extrapolated flux
+    """
+    comp = _spectral_component(component, numpy.linspace(1.02e8, 1.2e8, 7))
+    with pytest.raises(ValueError):
+        extract_direction_and_flux(comp, visibility)
@@ -46,8 +46,8 @@ def imaging_fixture():
     channelwidth = numpy.array([1e6])
     vis_pol = PolarisationFrame("stokesI")
     f = numpy.array([100.0])
-    flux = numpy.array(
-        [f * numpy.power(freq / 1e8, -0.7) for freq in frequency]
+    flux = f[numpy.newaxis, :] * numpy.power(
+        frequency[:, numpy.newaxis] / 1e8, -0.7
     )
     phase_centre = SkyCoord(
         ra=+180.0 * u.deg, dec=-45.0 * u.deg, frame="icrs", equinox="J2000"
@@ -3,7 +3,6 @@
 Unit tests for imaging using nifty gridder
 """
 import logging
-import os
 import sys
 import tempfile
 
@@ -21,6 +20,7 @@ from ska_sdp_datamodels.science_data_model.polarisation_model import (
 from ska_sdp_datamodels.visibility.vis_create import create_visibility
 
 from ska_sdp_func_python.imaging.wg import invert_wg, predict_wg
+from tests.testing_utils import env_flag
 
 pytest.skip(allow_module_level=True, reason="Imports for WAGG")
 
@@ -32,7 +32,7 @@ log.addHandler(logging.StreamHandler(sys.stdout))
 
 @pytest.fixture(scope="module", name="result_wg")
 def wg_fixture():
-    persist = os.getenv("FUNC_PYTHON_PERSIST", False)
+    persist = env_flag("FUNC_PYTHON_PERSIST")
     verbosity = 0
     npixel = 256
     low = create_named_configuration("LOWBD2", rmax=750.0)
@@ -281,6 +281,50 @@ def test_restore_skycomponent(image, sky_comp_two):
     assert new_image != image
 
 
+def _spectral_skycomponent(direction, frequency):
+    """
+    Linear-polarisation SkyComponent with a flux linear in frequency,
+    which a cubic spline reproduces exactly
+    """
+    return SkyComponent(
+        direction=direction,
+        frequency=frequency,
+        flux=numpy.outer(frequency / 1e8, [1.0, 0.0, 0.0, 1.0]),
+        polarisation_frame=PolarisationFrame("linear"),
+    )
+
+
+def test_insert_skycomponent_spectral(image, comp_direction):
+    """Check a multi-channel skycomponent is interpolated to the image
+    frequencies when inserted"""
+    comp = _spectral_skycomponent(
+        comp_direction, numpy.linspace(0.9e8, 1.2e8, 7)
+    )
+    new_image = insert_skycomponent(image.copy(deep=True), comp)
+
+    expected = numpy.outer(image.frequency.data / 1e8, [1.0, 0.0, 0.0, 1.0])
+    inserted = new_image["pixels"].data - image["pixels"].data
+    numpy.testing.assert_allclose(
+        inserted.max(axis=(2, 3)), expected, atol=1e-12
+    )
+
+
+def test_skycomponent_out_of_band(image, comp_direction):
+    """Check that image frequencies outside the range of a multi-channel
+    skycomponent are not extrapolated"""
+    comp = _spectral_skycomponent(
+        comp_direction, numpy.linspace(1.02e8, 1.2e8, 7)
+    )
+    with pytest.raises(ValueError):
+        insert_skycomponent(image.copy(deep=True), comp)
+
+    clean_beam = {"bmaj": 0.1, "bmin": 0.05, "bpa": -60.0}
+    with pytest.raises(ValueError):
+        restore_skycomponent(
+            image.copy(deep=True), comp, clean_beam=clean_beam
+        )
+
+
 def test_voronoi_decomposition(
     image, sky_comp_one, sky_comp_two, sky_comp_three
 ):
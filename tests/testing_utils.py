@@ -3,10 +3,12 @@ Util functions for testing.
 """
 
 import logging
+import os
 
 import numpy
 from astropy import units as u
 from astropy.coordinates import SkyCoord
+from numpy.random import default_rng
 from ska_sdp_datamodels.calibration import GainTable
 from ska_sdp_datamodels.configuration import create_named_configuration
 from ska_sdp_datamodels.science_data_model import PolarisationFrame
@@ -18,6 +20,19 @@ from ska_sdp_func_python.imaging import dft_skycomponent_visibility
 log = logging.getLogger("func-python-logger")
 
 
+def env_flag(name):
+    """
+    Read a boolean switch from an environment variable
+
+    Only 1, true or yes (in any case) turn the switch on, since any
+    non-empty string, including "False" or "0", is truthy.
+
+    :param name: Name of the environment variable
+    :return: True if the switch is on
+    """
+    return os.getenv(name, "").lower() in ("1", "true", "yes")
+
+
 def simulate_gaintable(
     gain_table: GainTable,
     phase_error=0.1,
@@ -33,9 +48,6 @@ def simulate_gaintable(
     :param leakage: std of cross hand leakage
     :return: updated GainTable
     """
-    # pylint: disable=import-outside-toplevel
-    from numpy.random import default_rng
-
     rng = default_rng(1805550721)
 
     log.debug(
@@ -124,7 +136,7 @@ def vis_with_component_data(
     if sky_pol_frame == "stokesI":
         flux_array = [100.0]
     flux = numpy.outer(
-        numpy.array([numpy.power(freq / 1e8, -0.7) for freq in frequency]),
+        numpy.power(frequency / 1e8, -0.7),
         flux_array,
     )
 
@@ -2,10 +2,12 @@
 Unit tests for Array functions
 """
 import numpy
+import pytest
 
 from ska_sdp_func_python.util.array_functions import (
     average_chunks,
     average_chunks2,
+    interpolate_spectrum,
 )
 
 
@@ -95,3 +97,42 @@ def test_average_chunks2_2d():
     answerwts = numpy.array([5.0, 5.0, 1.0])
     numpy.testing.assert_array_equal(carr[:, 5], answerarr)
     numpy.testing.assert_array_equal(cwts[:, 5], answerwts)
+
+
+@pytest.mark.parametrize("nchan, degree", [(2, 1), (3, 2), (8, 3)])
+def test_interpolate_spectrum(nchan, degree):
+    """Unit test for interpolate_spectrum function
+
+    Polynomial spectra up to the spline degree are interpolated exactly.
+    """
+    frequency = numpy.linspace(1.0e8, 1.2e8, nchan)
+    new_frequency = numpy.linspace(1.0e8, 1.2e8, 11)
+
+    def _spectrum(freq):
+        x = (freq - 1.1e8) / 1.0e7
+        return numpy.stack([x**degree, 1.0 + x], axis=1)
+
+    spectrum = interpolate_spectrum(
+        frequency, _spectrum(frequency), new_frequency
+    )
+    assert spectrum.shape == (11, 2)
+    numpy.testing.assert_allclose(
+        spectrum, _spectrum(new_frequency), atol=1e-12
+    )
+
+
+def test_interpolate_spectrum_out_of_range():
+    """Unit test for interpolate_spectrum function
+
+    Frequencies outside the range of the spectra are not extrapolated.
+    """
+    frequency = numpy.linspace(1.0e8, 1.2e8, 8)
+    spectrum = numpy.ones([8, 1])
+    with pytest.raises(ValueError):
+        interpolate_spectrum(
+            frequency, spectrum, numpy.linspace(0.9e8, 1.2e8, 7)
+        )
+    with pytest.raises(ValueError):
+        interpolate_spectrum(
+            frequency, spectrum, numpy.linspace(1.0e8, 1.3e8, 7)
+        )